@@ -3,7 +3,6 @@ import tomlkit
 import tomlkit.exceptions
 import json
 import traceback
-from collections import deque
 from pathlib import Path
 
 from ..internal.core_args import CoreArgs
@@ -95,25 +94,27 @@ def _generateINIconfig(config: dict, dstPath: StrPath) -> None:
         Path-like object pointing to a ini file.
         Note: the file does not have to exist.
     """
-    document = ""
-    q = deque()  # type: deque[dict]
-    q.append(config)
-    parents = deque()  # type: deque[str]
-
-    while q:
-        table = ""
-        current_parent = f"{parents[0]}." if parents else ""
-        for key, value in q.popleft().items():
+    document = []  # type: list[str]
+    # Breadth-first walk over (section name, table) pairs;
+    # sections are emitted in visit order.
+    q = [("", config)]  # type: list[tuple[str, dict]]
+    i = 0
+
+    while i < len(q):
+        section, current_table = q[i]
+        i += 1
+        table = []  # type: list[str]
+        current_parent = f"{section}." if section else ""
+        for key, value in current_table.items():
             if isinstance(value, dict):
-                parents.append(f"{current_parent}{key}")
-                q.append(value)
+                q.append((f"{current_parent}{key}", value))
             else:
-                table += f"{key} = {value}\n"
+                table.append(f"{key} = {value}\n")
         else:
             if table:
-                section_header = f"[{parents.popleft()}]" if parents else ""
-                document += section_header + "\n"
-                document += table + "\n\n"
+                section_header = f"[{section}]" if section else ""
+                document.append(section_header + "\n")
+                document.append("".join(table) + "\n\n")
 
     fileName = os.path.split(dstPath)[1]
     with open(dstPath, "w", encoding="utf-8") as file:
@@ -4,6 +4,6 @@ def makeAppArgs(cls):
 
     for k, v in cls.__dict__.items():
         # Ensure in-built attributes are not copied (i.e. prefix or postfix is not "__")
-        if k[:2].count("_") != 2 and k[-2:].count("_") != 2:
+        if not k.startswith("__") and not k.endswith("__"):
             setattr(CoreArgs, k, v)
     return cls
@@ -23,13 +23,7 @@ def iterToString(arg: Iterable, separator: str = "") -> str:
     if arg is None:
         return f"{arg}"
 
-    string = ""
-    for i, item in enumerate(arg):
-        if i == len(arg) - 1:
-            string += f"{item}"
-        else:
-            string += f"{item}" + separator
-    return string
+    return separator.join(f"{item}" for item in arg)
 
 
 def dictLookup(input: dict, search_param: Any) -> Any:
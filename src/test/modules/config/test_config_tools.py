@@ -0,0 +1,23 @@
+from applib.module.config.tools.config_tools import _generateINIconfig
+
+
+def _writeINI(config: dict, tmp_path) -> str:
+    dst_path = tmp_path / "config.ini"
+    _generateINIconfig(config, dst_path)
+    return dst_path.read_text(encoding="utf-8")
+
+
+def test_ini_root_values_next_to_sections(tmp_path):
+    # Root-level values must not be written under the first sub-section's header
+    assert (
+        _writeINI({"x": 1, "A": {"y": 2}}, tmp_path)
+        == "\nx = 1\n\n\n[A]\ny = 2\n\n\n"
+    )
+
+
+def test_ini_table_with_only_subtables(tmp_path):
+    # A table holding only sub-tables must not shift the headers of later sections
+    assert (
+        _writeINI({"A": {"B": {"y": 2}}, "C": {"z": 3}}, tmp_path)
+        == "[C]\nz = 3\n\n\n[A.B]\ny = 2\n\n\n"
+    )